@@ -4,14 +4,17 @@ bot — Core modules for the Binance Futures Testnet trading bot.
 Submodules
 ----------
 client          Low-level REST client with HMAC-SHA256 authentication.
+async_client    aiohttp-based async client (optional ``aiohttp`` dependency).
 orders          Order-placement logic and response formatting.
 validators      Input validation for CLI / web parameters.
 logging_config  Dual-output logging (console + rotating file).
+
+Re-exports are resolved lazily (PEP 562): importing :mod:`bot` — or a
+pure-stdlib submodule such as :mod:`bot.validators` — does not pull in
+requests/urllib3 until a client is actually needed.
 """
 
-from bot.client import BinanceFuturesClient, BinanceAPIError
-from bot.orders import place_order, format_order_response
-from bot.validators import validate_all
+from typing import Any
 
 __all__ = [
     "BinanceFuturesClient",
@@ -20,3 +23,26 @@ __all__ = [
     "format_order_response",
     "validate_all",
 ]
+
+# Re-exported name -> providing submodule.
+_EXPORTS = {
+    "BinanceFuturesClient": "client",
+    "BinanceAPIError": "client",
+    "place_order": "orders",
+    "format_order_response": "orders",
+    "validate_all": "validators",
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    from importlib import import_module
+
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # cache so later lookups skip __getattr__
+    return value
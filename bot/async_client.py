@@ -0,0 +1,174 @@
+"""
+Async Binance Futures Testnet REST client.
+
+Mirrors :class:`bot.client.BinanceFuturesClient` on top of ``aiohttp`` so
+related signed endpoints (account, positions, open orders) can be fetched
+concurrently over one keep-alive connection instead of serializing three
+round-trips.  Requires the optional ``aiohttp`` dependency::
+
+    pip install aiohttp
+"""
+
+from __future__ import annotations
+
+import asyncio
+import binascii
+import hashlib
+import logging
+import time
+from typing import Any, Dict, List, Optional, Union
+
+import aiohttp
+import orjson
+
+from .client import BASE_URL, BinanceAPIError, _SHA256_BLOCK_SIZE, _encode_params
+
+logger = logging.getLogger("trading_bot")
+
+
+class AsyncBinanceFuturesClient:
+    """Async twin of ``BinanceFuturesClient`` built on aiohttp."""
+
+    def __init__(self, api_key: str, api_secret: str, base_url: str = BASE_URL):
+        self.api_key = api_key
+        self.base_url = base_url.rstrip("/")
+        # Same precomputed HMAC pad states as the sync client.
+        key = api_secret.encode("utf-8")
+        if len(key) > _SHA256_BLOCK_SIZE:
+            key = hashlib.sha256(key).digest()
+        key = key.ljust(_SHA256_BLOCK_SIZE, b"\x00")
+        self._hmac_inner = hashlib.sha256(bytes(b ^ 0x36 for b in key))
+        self._hmac_outer = hashlib.sha256(bytes(b ^ 0x5C for b in key))
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    # ── context-manager support ────────────────────────────────────────
+
+    async def __aenter__(self) -> "AsyncBinanceFuturesClient":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    # ── internal helpers ───────────────────────────────────────────────
+
+    def _ensure_session(self) -> aiohttp.ClientSession:
+        """Lazily create the shared session on the running event loop."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=32, ttl_dns_cache=300, keepalive_timeout=75
+                ),
+                headers={"X-MBX-APIKEY": self.api_key},
+                timeout=aiohttp.ClientTimeout(total=10),
+            )
+        return self._session
+
+    def _sign(self, params: Dict[str, Any]) -> str:
+        """Return the full signed query string for *params*.
+
+        Same single-encode contract as the sync client's ``_sign``.
+        """
+        params["timestamp"] = time.time_ns() // 1_000_000
+        query_string = _encode_params(params)
+        inner = self._hmac_inner.copy()
+        inner.update(query_string.encode("utf-8"))
+        outer = self._hmac_outer.copy()
+        outer.update(inner.digest())
+        signature = binascii.b2a_hex(outer.digest()).decode("ascii")
+        return f"{query_string}&signature={signature}"
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        signed: bool = False,
+    ) -> Union[Dict[str, Any], List[Any]]:
+        """
+        Send an HTTP request to the Binance API.
+
+        Same contract as the sync client's ``_request`` (including taking
+        ownership of *params*); raises ``BinanceAPIError`` on non-2xx
+        responses and ``aiohttp.ClientError`` on network-level failures.
+        """
+        if params is None:
+            params = {}
+
+        url = f"{self.base_url}{path}"
+        if signed:
+            url = f"{url}?{self._sign(params)}"
+        elif params:
+            url = f"{url}?{_encode_params(params)}"
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("API request  -> %s %s%s", method, self.base_url, path)
+
+        session = self._ensure_session()
+        async with session.request(method, url) as response:
+            body = await response.read()
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "API response <- %s (%.1f KB)", response.status, len(body) / 1024
+                )
+
+            if not 200 <= response.status < 300:
+                try:
+                    parsed = orjson.loads(body)
+                    code = parsed.get("code", -1)
+                    msg = parsed.get("msg", body.decode("utf-8", "replace"))
+                except ValueError:
+                    code = -1
+                    msg = body.decode("utf-8", "replace")
+                raise BinanceAPIError(response.status, code, msg)
+
+            return orjson.loads(body)
+
+    # ── public API methods ─────────────────────────────────────────────
+
+    async def ping(self) -> Dict[str, Any]:
+        """Test connectivity to the API (``GET /fapi/v1/ping``)."""
+        return await self._request("GET", "/fapi/v1/ping")
+
+    async def get_account(self) -> Dict[str, Any]:
+        """Fetch account information (``GET /fapi/v2/account``)."""
+        return await self._request("GET", "/fapi/v2/account", signed=True)
+
+    async def get_positions(self) -> List[Dict[str, Any]]:
+        """Get position information (``GET /fapi/v2/positionRisk``)."""
+        return await self._request("GET", "/fapi/v2/positionRisk", signed=True)
+
+    async def get_open_orders(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get current open orders (``GET /fapi/v1/openOrders``)."""
+        params: Dict[str, Any] = {}
+        if symbol:
+            params["symbol"] = symbol
+        return await self._request("GET", "/fapi/v1/openOrders", params=params, signed=True)
+
+    async def get_ticker_price(self, symbol: str) -> Dict[str, Any]:
+        """Get latest price for a symbol (``GET /fapi/v1/ticker/price``)."""
+        return await self._request("GET", "/fapi/v1/ticker/price", params={"symbol": symbol})
+
+    async def snapshot(self) -> Dict[str, Any]:
+        """
+        Fetch account, positions, and open orders concurrently.
+
+        The three signed GETs share one keep-alive connection and run in
+        parallel, so wall time is the slowest round-trip rather than the
+        sum of all three.
+        """
+        account, positions, open_orders = await asyncio.gather(
+            self.get_account(),
+            self.get_positions(),
+            self.get_open_orders(),
+        )
+        return {
+            "account": account,
+            "positions": positions,
+            "openOrders": open_orders,
+        }
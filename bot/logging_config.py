@@ -9,23 +9,49 @@ Log files are stored in ``<project-root>/logs/`` and are automatically
 rotated when they exceed 5 MB, keeping the last 5 backups.
 """
 
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from typing import Optional
 
 LOG_DIR = Path(__file__).resolve().parent.parent / "logs"
 
+# None of the formats below use thread/process fields, so skip collecting
+# them on every LogRecord.
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
 # Rotation settings
 _MAX_BYTES = 5 * 1024 * 1024  # 5 MB per file
 _BACKUP_COUNT = 5              # keep 5 old rotated files
 
+# Background listener draining the log queue into the file handler.
+# Kept at module scope so repeated setup_logging() calls find it.
+_listener: Optional[QueueListener] = None
+
+
+def _stop_listener() -> None:
+    """Flush and stop the queue listener (idempotent)."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
 
 def setup_logging(log_level: int = logging.DEBUG) -> logging.Logger:
     """
     Configure and return the application logger.
 
     Creates a ``logs/`` directory next to the package root and writes to
-    a rotating log file (``trading_bot.log``).
+    a rotating log file (``trading_bot.log``).  Handler I/O — console
+    writes, file writes and rotation renames — happens on a background
+    ``QueueListener`` thread.  Note that ``QueueHandler.prepare()``
+    still formats the record (args merge, traceback rendering) on the
+    emitting thread before enqueueing; what the queue buys is keeping
+    the blocking writes off the trading and request hot paths.
 
     Parameters
     ----------
@@ -55,20 +81,38 @@ def setup_logging(log_level: int = logging.DEBUG) -> logging.Logger:
         encoding="utf-8",
     )
     file_handler.setLevel(log_level)
+    # {-style, no funcName/lineno: those fields force caller-frame
+    # extraction on every record, which is the expensive part of a
+    # logger.debug on the request hot path.
     file_fmt = logging.Formatter(
-        "%(asctime)s | %(levelname)-8s | %(name)s.%(funcName)s:%(lineno)d | %(message)s",
+        "{asctime} | {levelname:<8} | {name} | {message}",
         datefmt="%Y-%m-%d %H:%M:%S",
+        style="{",
+        validate=False,
     )
     file_handler.setFormatter(file_fmt)
 
     # --- Console handler (concise) ---------------------------------------------
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
-    console_fmt = logging.Formatter("%(levelname)-8s | %(message)s")
+    console_fmt = logging.Formatter("{levelname:<8} | {message}", style="{", validate=False)
     console_handler.setFormatter(console_fmt)
 
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # --- Queue indirection: callers enqueue, the listener thread writes ------
+    # Both handlers sit behind the queue; respect_handler_level keeps the
+    # console at INFO while the file still receives DEBUG records.
+    global _listener
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    _listener = QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    _listener.start()
+    atexit.register(_stop_listener)
+
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setLevel(log_level)
+
+    logger.addHandler(queue_handler)
 
     logger.debug("Logging initialised – file: %s", log_file)
     return logger
@@ -7,7 +7,6 @@ Bridges validated user input and the low-level ``BinanceFuturesClient``.
 from __future__ import annotations
 
 import logging
-from decimal import Decimal
 from typing import Any, Dict, Optional
 
 from .client import BinanceFuturesClient
@@ -20,8 +19,8 @@ def place_order(
     symbol: str,
     side: str,
     order_type: str,
-    quantity: Decimal,
-    price: Optional[Decimal] = None,
+    quantity: str,
+    price: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Build the parameter dict and forward to ``client.place_order``.
@@ -31,7 +30,8 @@ def place_order(
     client : BinanceFuturesClient
         Authenticated API client.
     symbol, side, order_type, quantity, price
-        Already-validated trading parameters.
+        Already-validated trading parameters.  ``quantity`` and ``price``
+        are decimal strings as produced by ``validators.validate_all``.
 
     Returns
     -------
@@ -42,11 +42,11 @@ def place_order(
         "symbol": symbol,
         "side": side,
         "type": order_type,
-        "quantity": str(quantity),
+        "quantity": quantity,
     }
 
     if order_type == "LIMIT":
-        params["price"] = str(price)
+        params["price"] = price
         params["timeInForce"] = "GTC"  # Good-Til-Cancelled
 
     logger.info(
@@ -66,24 +66,35 @@ def place_order(
     return response
 
 
+# Prebuilt template for format_order_response: one C-level format_map walk
+# per call instead of a dozen intermediate f-strings plus a list + join.
+_RESPONSE_TEMPLATE = """\
+─── Order Response ───────────────────────────
+  Order ID      : {orderId}
+  Symbol        : {symbol}
+  Side          : {side}
+  Type          : {type}
+  Status        : {status}
+  Orig Qty      : {origQty}
+  Executed Qty  : {executedQty}
+  Avg Price     : {avgPrice}
+  Price         : {price}
+  Time In Force : {timeInForce}
+───────────────────────────────────────────────"""
+
+
+class _Defaulted(dict):
+    """Mapping view over a response dict that yields ``N/A`` for gaps."""
+
+    def __missing__(self, key: str) -> str:
+        return "N/A"
+
+
 def format_order_response(response: Dict[str, Any]) -> str:
     """
     Return a human-friendly multi-line summary of an order response.
 
-    Extracts the most useful fields and formats them for CLI output.
+    Extracts the most useful fields and formats them for CLI output;
+    fields missing from the response render as ``N/A``.
     """
-    lines = [
-        "─── Order Response ───────────────────────────",
-        f"  Order ID      : {response.get('orderId')}",
-        f"  Symbol        : {response.get('symbol')}",
-        f"  Side          : {response.get('side')}",
-        f"  Type          : {response.get('type')}",
-        f"  Status        : {response.get('status')}",
-        f"  Orig Qty      : {response.get('origQty')}",
-        f"  Executed Qty  : {response.get('executedQty')}",
-        f"  Avg Price     : {response.get('avgPrice', 'N/A')}",
-        f"  Price         : {response.get('price', 'N/A')}",
-        f"  Time In Force : {response.get('timeInForce', 'N/A')}",
-        "───────────────────────────────────────────────",
-    ]
-    return "\n".join(lines)
+    return _RESPONSE_TEMPLATE.format_map(_Defaulted(response))
@@ -8,44 +8,96 @@ when validation fails.
 from __future__ import annotations
 
 import re
+import string
 from decimal import Decimal, InvalidOperation
-from typing import Optional, Union
+from typing import List, Optional, Union
 
-# Binance Futures symbols are uppercase alphanumeric (e.g. BTCUSDT, ETHUSDT).
-_SYMBOL_RE = re.compile(r"^[A-Z0-9]{2,20}$")
+try:
+    # Optional: google-re2 compiles patterns to a linear-time DFA, which
+    # pays off on batch workloads (pip install google-re2).  The module
+    # mirrors the stdlib ``re`` API, so it is a drop-in swap.
+    import re2 as _re
+except ImportError:
+    _re = re
 
-VALID_SIDES = ("BUY", "SELL")
-VALID_ORDER_TYPES = ("MARKET", "LIMIT")
+# Binance Futures symbols are uppercase alphanumeric (e.g. BTCUSDT,
+# ETHUSDT); the whole newline-joined symbol list is checked in one scan.
+_SYMBOL_BATCH_RE = _re.compile(r"[A-Z0-9]{2,20}(?:\n[A-Z0-9]{2,20})*")
+
+# Deletion table stripping every allowed symbol character: a valid symbol
+# translates to the empty string, so the check is a single C-level scan
+# over the string instead of a regex-engine run.
+_DISALLOWED_TT = str.maketrans("", "", string.ascii_uppercase + string.digits)
+
+# Binance's canonical quantity/price format: plain decimal digits with
+# an optional fractional part — no sign, exponent, or leading dot.
+_DECIMAL_RE = _re.compile(r"[0-9]{1,20}(?:\.[0-9]{1,20})?")
+
+VALID_SIDES = frozenset(("BUY", "SELL"))
+VALID_ORDER_TYPES = frozenset(("MARKET", "LIMIT"))
 
 
 def validate_symbol(symbol: str) -> str:
     """Return the uppercased symbol or raise on invalid format."""
     symbol = symbol.strip().upper()
-    if not _SYMBOL_RE.match(symbol):
-        raise ValueError(
-            f"Invalid symbol '{symbol}'. "
-            "Expected uppercase alphanumeric (e.g. BTCUSDT)."
-        )
-    return symbol
+    if 2 <= len(symbol) <= 20 and not symbol.translate(_DISALLOWED_TT):
+        return symbol
+    raise ValueError(
+        f"Invalid symbol '{symbol}'. "
+        "Expected uppercase alphanumeric (e.g. BTCUSDT)."
+    )
+
+
+def validate_symbols_batch(symbols: List[str]) -> List[str]:
+    """
+    Validate many symbols at once and return them uppercased.
+
+    The whole batch is checked with a single regex scan over the
+    newline-joined list, amortizing per-symbol dispatch for market
+    scanners that validate hundreds of symbols.  On failure the batch is
+    re-walked with :func:`validate_symbol` so the error names the first
+    offending entry.
+
+    Raises
+    ------
+    ValueError
+        If any symbol in the batch is invalid.
+    """
+    cleaned = [s.strip().upper() for s in symbols]
+    if not cleaned:
+        return cleaned
+    joined = "\n".join(cleaned)
+    # A newline embedded in an entry would read as a batch separator and
+    # slip past the scan, so the separator count must match the entry
+    # count; mismatches take the slow path, where validate_symbol raises.
+    if joined.count("\n") == len(cleaned) - 1 and _SYMBOL_BATCH_RE.fullmatch(joined):
+        return cleaned
+    for s in cleaned:
+        validate_symbol(s)
+    return cleaned
 
 
 def validate_side(side: str) -> str:
     """Return the uppercased side or raise if not BUY/SELL."""
+    if side in VALID_SIDES:  # already canonical — skip the normalization
+        return side
     side = side.strip().upper()
     if side not in VALID_SIDES:
         raise ValueError(
-            f"Invalid side '{side}'. Must be one of: {', '.join(VALID_SIDES)}."
+            f"Invalid side '{side}'. Must be one of: {', '.join(sorted(VALID_SIDES))}."
         )
     return side
 
 
 def validate_order_type(order_type: str) -> str:
     """Return the uppercased order type or raise if unsupported."""
+    if order_type in VALID_ORDER_TYPES:
+        return order_type
     order_type = order_type.strip().upper()
     if order_type not in VALID_ORDER_TYPES:
         raise ValueError(
             f"Invalid order type '{order_type}'. "
-            f"Must be one of: {', '.join(VALID_ORDER_TYPES)}."
+            f"Must be one of: {', '.join(sorted(VALID_ORDER_TYPES))}."
         )
     return order_type
 
@@ -60,8 +112,15 @@ def validate_quantity(quantity: Union[str, float]) -> Decimal:
         If *quantity* is not a valid positive number.
     """
     try:
-        qty = Decimal(str(quantity))
-    except (InvalidOperation, ValueError):
+        if isinstance(quantity, Decimal):
+            qty = quantity
+        elif isinstance(quantity, (str, int)):
+            qty = Decimal(quantity)
+        else:
+            # float: repr() gives the shortest round-trip text form,
+            # avoiding the str() detour through a second parse.
+            qty = Decimal(repr(quantity))
+    except (InvalidOperation, ValueError, TypeError):
         raise ValueError(f"Invalid quantity '{quantity}'. Must be a positive number.")
     if qty <= 0:
         raise ValueError(f"Quantity must be positive, got {qty}.")
@@ -87,14 +146,55 @@ def validate_price(price: Union[str, float, None], order_type: str) -> Optional[
         raise ValueError("Price is required for LIMIT orders.")
 
     try:
-        p = Decimal(str(price))
-    except (InvalidOperation, ValueError):
+        if isinstance(price, Decimal):
+            p = price
+        elif isinstance(price, (str, int)):
+            p = Decimal(price)
+        else:
+            p = Decimal(repr(price))
+    except (InvalidOperation, ValueError, TypeError):
         raise ValueError(f"Invalid price '{price}'. Must be a positive number.")
     if p <= 0:
         raise ValueError(f"Price must be positive, got {p}.")
     return p
 
 
+def validate_quantity_str(quantity: Union[str, float]) -> str:
+    """
+    Validate like :func:`validate_quantity` but return the decimal text form.
+
+    Binance accepts fixed-precision decimal strings, so keeping the value
+    as text end-to-end skips a Decimal allocation per order.  Only
+    already-canonical strings pass through verbatim; forms Decimal
+    accepts but Binance rejects (``"1e-3"``, ``".5"``, ``"+0.25"``) are
+    normalized through :func:`validate_quantity`.
+    """
+    if isinstance(quantity, str):
+        text = quantity.strip()
+        if _DECIMAL_RE.fullmatch(text):
+            validate_quantity(text)
+            return text
+    # format(..., "f") expands exponents ("9e4" -> "90000"), which
+    # str() on a Decimal would preserve.
+    return format(validate_quantity(quantity), "f")
+
+
+def validate_price_str(price: Union[str, float, None], order_type: str) -> Optional[str]:
+    """
+    Validate like :func:`validate_price` but return the decimal text form
+    (or ``None`` for MARKET orders).
+    """
+    if order_type == "MARKET":
+        return None
+    if isinstance(price, str):
+        text = price.strip()
+        if _DECIMAL_RE.fullmatch(text):
+            validate_price(text, order_type)
+            return text
+    p = validate_price(price, order_type)
+    return None if p is None else format(p, "f")
+
+
 def validate_all(
     symbol: str,
     side: str,
@@ -109,6 +209,8 @@ def validate_all(
     -------
     dict
         Keys: ``symbol``, ``side``, ``order_type``, ``quantity``, ``price``.
+        ``quantity`` and ``price`` are decimal strings ready to be sent
+        to the API as-is (``price`` is ``None`` for MARKET orders).
 
     Raises
     ------
@@ -118,8 +220,8 @@ def validate_all(
     v_symbol = validate_symbol(symbol)
     v_side = validate_side(side)
     v_type = validate_order_type(order_type)
-    v_qty = validate_quantity(quantity)
-    v_price = validate_price(price, v_type)
+    v_qty = validate_quantity_str(quantity)
+    v_price = validate_price_str(price, v_type)
 
     return {
         "symbol": v_symbol,
@@ -19,8 +19,6 @@ import argparse
 import os
 import sys
 
-from dotenv import load_dotenv
-
 # ── Bootstrap ──────────────────────────────────────────────────────────────
 # Ensure the package root is on sys.path so ``bot`` can be imported when this
 # script is executed directly (``python cli.py …``).
@@ -30,8 +28,10 @@ if SCRIPT_DIR not in sys.path:
 
 from bot.logging_config import setup_logging
 from bot.validators import validate_all
-from bot.client import BinanceFuturesClient, BinanceAPIError
-from bot.orders import place_order, format_order_response
+
+# ``bot.client`` / ``bot.orders`` (and with them requests + urllib3) are
+# imported inside main() only once validation has passed, so --help and
+# bad-input runs never pay the HTTP-stack import cost.
 
 # ── Argument parser ────────────────────────────────────────────────────────
 
@@ -47,8 +47,8 @@ def build_parser() -> argparse.ArgumentParser:
         ),
     )
     parser.add_argument("--symbol", required=True, help="Trading pair (e.g. BTCUSDT)")
-    parser.add_argument("--side", required=True, choices=["BUY", "SELL", "buy", "sell"], help="Order side")
-    parser.add_argument("--type", required=True, dest="order_type", choices=["MARKET", "LIMIT", "market", "limit"], help="Order type")
+    parser.add_argument("--side", required=True, type=str.upper, choices=["BUY", "SELL"], help="Order side")
+    parser.add_argument("--type", required=True, dest="order_type", type=str.upper, choices=["MARKET", "LIMIT"], help="Order type")
     parser.add_argument("--quantity", required=True, help="Order quantity")
     parser.add_argument("--price", default=None, help="Limit price (required for LIMIT orders)")
     return parser
@@ -58,7 +58,9 @@ def build_parser() -> argparse.ArgumentParser:
 
 
 def main() -> None:
-    # Load .env for API keys
+    # Load .env for API keys (imported here to keep cold-start lean)
+    from dotenv import load_dotenv
+
     load_dotenv(os.path.join(SCRIPT_DIR, ".env"))
 
     logger = setup_logging()
@@ -103,6 +105,9 @@ def main() -> None:
     print()
 
     # --- Place order --------------------------------------------------------
+    from bot.client import BinanceFuturesClient, BinanceAPIError
+    from bot.orders import place_order, format_order_response
+
     client = BinanceFuturesClient(api_key, api_secret)
 
     try:
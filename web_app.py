@@ -4,8 +4,9 @@ Lightweight Flask web UI for the Binance Futures Testnet trading bot.
 
 Run::
 
-    python web_app.py                # http://127.0.0.1:5000
+    python web_app.py                # http://127.0.0.1:5000 (gunicorn)
     python web_app.py --port 8080    # custom port
+    python web_app.py --dev          # Werkzeug dev server
 
 Environment variables (all optional — API keys loaded from ``.env``)::
 
@@ -14,13 +15,20 @@ Environment variables (all optional — API keys loaded from ``.env``)::
 
 from __future__ import annotations
 
+import hashlib
+import logging
 import os
 import sys
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Deque, Dict, Optional, Tuple, Union
 
+import orjson
 from dotenv import load_dotenv
 from flask import Flask, Response, jsonify, render_template, request
+from flask.json.provider import JSONProvider
 
 # ── Bootstrap ──────────────────────────────────────────────────────────────
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -29,6 +37,20 @@ if SCRIPT_DIR not in sys.path:
 
 load_dotenv(os.path.join(SCRIPT_DIR, ".env"))
 
+try:
+    # Optional: gzip/brotli compression for the larger JSON payloads
+    # (pip install Flask-Compress).
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
+
+try:
+    # Optional: typed single-pass decoding of the POST JSON bodies —
+    # decode + field typing in one C-level pass (pip install msgspec).
+    import msgspec
+except ImportError:
+    msgspec = None
+
 from bot.logging_config import setup_logging          # noqa: E402
 from bot.validators import validate_all               # noqa: E402
 from bot.client import BinanceFuturesClient, BinanceAPIError  # noqa: E402
@@ -36,19 +58,106 @@ from bot.orders import place_order                     # noqa: E402
 
 # ── App setup ──────────────────────────────────────────────────────────────
 logger = setup_logging()
+
+
+def _log_exc(msg: str, *args: Any) -> None:
+    """``logger.exception`` gated on level, so a silenced logger skips
+    traceback capture (``sys.exc_info`` + frame walk) entirely."""
+    if logger.isEnabledFor(logging.ERROR):
+        logger.exception(msg, *args)
+
+
+class _OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson (~3-10x faster than stdlib)."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+
 app = Flask(__name__, template_folder=os.path.join(SCRIPT_DIR, "templates"))
+app.json = _OrjsonProvider(app)
+
+if Compress is not None:
+    # JSON compresses ~5x; only bother above 1 KB (klines, account,
+    # order history) so small envelopes skip the compressor entirely.
+    app.config["COMPRESS_MIMETYPES"] = ["application/json"]
+    app.config["COMPRESS_LEVEL"] = 4
+    app.config["COMPRESS_MIN_SIZE"] = 1024
+    Compress(app)
 
 # ── Shared client (re-used across requests) ────────────────────────────────
 _client: Optional[BinanceFuturesClient] = None
 
-# In-memory order history (resets on restart — fine for a lightweight UI)
+# In-memory order history (resets on restart — fine for a lightweight UI).
+# Bounded deque: O(1) appendleft with automatic eviction of the oldest.
 _MAX_HISTORY = 200
-_order_history: List[Dict[str, Any]] = []
+_order_history: Deque[Dict[str, Any]] = deque(maxlen=_MAX_HISTORY)
+
+# /api/orders is polled far more often than orders are placed, so the
+# serialized envelope is memoized and invalidated on insert.
+_history_lock = threading.Lock()
+_history_json_cache: Optional[bytes] = None
+
+# Short-TTL LRU cache for market-data endpoints: several dashboard tabs
+# polling the same symbol within a couple of seconds collapse into one
+# upstream Binance call.  Values are pre-serialized response bytes.
+_MARKET_CACHE_TTL = 2.0
+_MARKET_CACHE_MAX = 256
+_market_cache: "OrderedDict[Tuple[Any, ...], Tuple[float, bytes]]" = OrderedDict()
+_market_cache_lock = threading.Lock()
+
+
+def _market_cache_get(key: Tuple[Any, ...]) -> Optional[bytes]:
+    """Return cached response bytes for *key*, or ``None`` if absent/stale."""
+    now = time.monotonic()
+    with _market_cache_lock:
+        entry = _market_cache.get(key)
+        if entry is None or now - entry[0] >= _MARKET_CACHE_TTL:
+            return None
+        _market_cache.move_to_end(key)  # LRU touch
+        return entry[1]
+
+
+def _market_cache_put(key: Tuple[Any, ...], payload: bytes) -> None:
+    """Store *payload* under *key*, evicting least-recently-used entries."""
+    with _market_cache_lock:
+        _market_cache[key] = (time.monotonic(), payload)
+        _market_cache.move_to_end(key)
+        while len(_market_cache) > _MARKET_CACHE_MAX:
+            _market_cache.popitem(last=False)
+
+
+if msgspec is not None:
+    class _OrderBody(msgspec.Struct):
+        """Typed view of the ``/api/order`` JSON body."""
+
+        symbol: str = ""
+        side: str = ""
+        order_type: str = ""
+        quantity: Union[str, float, int] = ""
+        price: Union[str, float, None] = None
+
+    class _CancelBody(msgspec.Struct):
+        """Typed view of the ``/api/cancel-order`` JSON body."""
+
+        symbol: str = ""
+        orderId: Union[int, str, None] = None
+
+    _decode_order_body = msgspec.json.Decoder(_OrderBody).decode
+    _decode_cancel_body = msgspec.json.Decoder(_CancelBody).decode
 
 
 def _get_client() -> BinanceFuturesClient:
     """Return a shared client instance, creating it on first call.
 
+    The singleton lives for the worker lifetime, so every request rides
+    the client's keep-alive connection pool instead of opening a fresh
+    TCP+TLS connection to Binance; the pool is sized for the threaded
+    WSGI workers serving concurrent dashboard polls.
+
     Raises
     ------
     RuntimeError
@@ -65,19 +174,44 @@ def _get_client() -> BinanceFuturesClient:
             "Missing API credentials. Set BINANCE_API_KEY and "
             "BINANCE_API_SECRET in .env or as environment variables."
         )
-    _client = BinanceFuturesClient(api_key, api_secret)
+    _client = BinanceFuturesClient(api_key, api_secret, pool_maxsize=50)
     logger.info("Binance client initialised (shared instance)")
     return _client
 
 
 def _ok(data: Any) -> Tuple[Response, int]:
-    """Standard JSON success envelope."""
-    return jsonify({"success": True, "data": data}), 200
+    """Standard JSON success envelope (orjson bytes, no utf-8 round-trip)."""
+    return app.response_class(
+        orjson.dumps({"success": True, "data": data}),
+        mimetype="application/json",
+    ), 200
+
+
+def _etag_response(payload: bytes) -> Tuple[Response, int]:
+    """Serve *payload* with an ETag, answering ``If-None-Match`` with 304.
+
+    The tag is a cheap 8-byte blake2b of the serialized bytes, so an
+    unchanged poll costs the client nothing but headers.
+    """
+    etag = hashlib.blake2b(payload, digest_size=8).hexdigest()
+    if request.headers.get("If-None-Match") == etag:
+        return app.response_class(status=304), 304
+    resp = app.response_class(payload, mimetype="application/json")
+    resp.headers["ETag"] = etag
+    return resp, 200
+
+
+# Constant frame of the error envelope; only the message gets serialized.
+_ERR_PREFIX = b'{"success":false,"error":'
+_ERR_SUFFIX = b"}"
 
 
 def _error(exc: Exception, status: int = 500) -> Tuple[Response, int]:
     """Standard JSON error envelope."""
-    return jsonify({"success": False, "error": str(exc)}), status
+    return app.response_class(
+        _ERR_PREFIX + orjson.dumps(str(exc)) + _ERR_SUFFIX,
+        mimetype="application/json",
+    ), status
 
 
 # ── Routes ─────────────────────────────────────────────────────────────────
@@ -94,38 +228,56 @@ def index() -> str:
 
 @app.route("/api/ticker/<symbol>")
 def api_ticker(symbol: str) -> Tuple[Response, int]:
-    """24-hr ticker statistics for *symbol*."""
+    """24-hr ticker statistics for *symbol* (cached ~2 s)."""
+    sym = symbol.upper()
+    key = ("ticker", sym)
+    cached = _market_cache_get(key)
+    if cached is not None:
+        return _etag_response(cached)
     try:
-        data = _get_client().get_ticker_24hr(symbol.upper())
-        return _ok(data)
+        data = _get_client().get_ticker_24hr(sym)
+        payload = orjson.dumps({"success": True, "data": data})
+        _market_cache_put(key, payload)
+        return _etag_response(payload)
     except BinanceAPIError as exc:
         return _error(exc, 502)
     except Exception as exc:
-        logger.exception("Ticker error for %s", symbol)
+        _log_exc("Ticker error for %s", symbol)
         return _error(exc)
 
 
 @app.route("/api/klines/<symbol>")
 def api_klines(symbol: str) -> Tuple[Response, int]:
-    """Candlestick data.  Query params: ``?interval=1h&limit=50``."""
+    """Candlestick data (cached ~2 s).  Query params: ``?interval=1h&limit=50``.
+
+    Rows are positional arrays ``[t, o, h, l, c, v]`` (open time, open,
+    high, low, close, volume) — no per-candle key overhead in the
+    payload or the serializer.
+    """
     try:
-        interval = request.args.get("interval", "1h")
-        limit_str = request.args.get("limit", "50")
+        args = request.args  # one LocalProxy dereference, not one per .get
+        interval = args.get("interval", "1h")
+        limit_str = args.get("limit", "50")
         try:
             limit = min(int(limit_str), 500)
         except ValueError:
             return _error(ValueError(f"Invalid limit: {limit_str!r}"), 400)
 
-        raw = _get_client().get_klines(symbol.upper(), interval, limit)
-        candles = [
-            {"t": c[0], "o": c[1], "h": c[2], "l": c[3], "c": c[4], "v": c[5]}
-            for c in raw
-        ]
-        return _ok(candles)
+        sym = symbol.upper()
+        key = ("klines", sym, interval, limit)
+        cached = _market_cache_get(key)
+        if cached is not None:
+            return _etag_response(cached)
+
+        raw = _get_client().get_klines(sym, interval, limit)
+        candles = [c[:6] for c in raw]
+        payload = orjson.dumps({"success": True, "data": candles})
+        _market_cache_put(key, payload)
+        return _etag_response(payload)
     except BinanceAPIError as exc:
         return _error(exc, 502)
     except Exception as exc:
-        logger.exception("Klines error for %s", symbol)
+        _log_exc("Klines error for %s", symbol)
         return _error(exc)
 
 
@@ -137,22 +289,24 @@ def api_account() -> Tuple[Response, int]:
     """Account balances and margin info."""
     try:
         data = _get_client().get_account()
+        _float = float  # local binding: one global lookup, not one per asset
         assets = [
-            a for a in data.get("assets", [])
-            if float(a.get("walletBalance", 0)) > 0
+            a for a in data.get("assets", ())
+            if _float(a.get("walletBalance") or 0) > 0
         ]
+        get = data.get
         summary = {
-            "totalWalletBalance": data.get("totalWalletBalance"),
-            "totalUnrealizedProfit": data.get("totalUnrealizedProfit"),
-            "totalMarginBalance": data.get("totalMarginBalance"),
-            "availableBalance": data.get("availableBalance"),
+            "totalWalletBalance": get("totalWalletBalance"),
+            "totalUnrealizedProfit": get("totalUnrealizedProfit"),
+            "totalMarginBalance": get("totalMarginBalance"),
+            "availableBalance": get("availableBalance"),
             "assets": assets,
         }
-        return _ok(summary)
+        return _etag_response(orjson.dumps({"success": True, "data": summary}))
     except BinanceAPIError as exc:
         return _error(exc, 502)
     except Exception as exc:
-        logger.exception("Account error")
+        _log_exc("Account error")
         return _error(exc)
 
 
@@ -160,13 +314,49 @@ def api_account() -> Tuple[Response, int]:
 def api_positions() -> Tuple[Response, int]:
     """Open positions (non-zero amount only)."""
     try:
-        all_pos = _get_client().get_positions()
-        active = [p for p in all_pos if float(p.get("positionAmt", 0)) != 0]
+        _float = float  # local binding for the ~200-row filter below
+        active = [
+            p for p in _get_client().get_positions()
+            if _float(p.get("positionAmt") or 0)
+        ]
         return _ok(active)
     except BinanceAPIError as exc:
         return _error(exc, 502)
     except Exception as exc:
-        logger.exception("Positions error")
+        _log_exc("Positions error")
+        return _error(exc)
+
+
+# Executor for the composite dashboard endpoint.  The upstream calls
+# release the GIL on socket IO, so the three fetches genuinely overlap.
+_dashboard_pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix="dashboard")
+
+
+@app.route("/api/dashboard")
+def api_dashboard() -> Tuple[Response, int]:
+    """Account summary + active positions + open orders in one response.
+
+    The three signed Binance calls run concurrently on a thread pool, so
+    a dashboard refresh costs the slowest round-trip instead of the sum
+    of all three.
+    """
+    try:
+        client = _get_client()
+        futures = {
+            "account": _dashboard_pool.submit(client.get_account),
+            "positions": _dashboard_pool.submit(client.get_positions),
+            "openOrders": _dashboard_pool.submit(client.get_open_orders),
+        }
+        result = {key: fut.result(timeout=10) for key, fut in futures.items()}
+        _float = float
+        result["positions"] = [
+            p for p in result["positions"] if _float(p.get("positionAmt") or 0)
+        ]
+        return _ok(result)
+    except BinanceAPIError as exc:
+        return _error(exc, 502)
+    except Exception as exc:
+        _log_exc("Dashboard error")
         return _error(exc)
 
 
@@ -176,13 +366,29 @@ def api_positions() -> Tuple[Response, int]:
 @app.route("/api/order", methods=["POST"])
 def api_place_order() -> Tuple[Response, int]:
     """Place an order.  JSON body: ``{ symbol, side, order_type, quantity, price? }``."""
-    body = request.get_json(silent=True) or {}
-
-    symbol = body.get("symbol", "")
-    side = body.get("side", "")
-    order_type = body.get("order_type", "")
-    quantity = body.get("quantity", "")
-    price = body.get("price") or None
+    raw = request.get_data(cache=False)
+    if msgspec is not None:
+        try:
+            parsed = _decode_order_body(raw) if raw else _OrderBody()
+        except msgspec.DecodeError as exc:
+            return _error(exc, 400)
+        symbol, side = parsed.symbol, parsed.side
+        order_type, quantity = parsed.order_type, parsed.quantity
+        price = parsed.price or None
+    else:
+        # Direct orjson parse: no mime sniffing, and a malformed body is
+        # a clear 400 instead of get_json silently yielding {}.
+        try:
+            body = orjson.loads(raw) if raw else {}
+        except orjson.JSONDecodeError as exc:
+            return _error(ValueError(f"Invalid JSON body: {exc}"), 400)
+        if not isinstance(body, dict):
+            return _error(ValueError("JSON body must be an object"), 400)
+        symbol = body.get("symbol", "")
+        side = body.get("side", "")
+        order_type = body.get("order_type", "")
+        quantity = body.get("quantity", "")
+        price = body.get("price") or None
 
     # Validate
     try:
@@ -208,12 +414,14 @@ def api_place_order() -> Tuple[Response, int]:
         logger.error("Client error: %s", exc)
         return _error(exc)
     except Exception as exc:
-        logger.exception("Unexpected order error")
+        _log_exc("Unexpected order error")
         return _error(exc)
 
     # Record in session history
     record: Dict[str, Any] = {
-        "time": datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC"),
+        # time.strftime over gmtime() skips building a datetime + tzinfo
+        # object per order; output format is identical.
+        "time": time.strftime("%Y-%m-%d %H:%M:%S UTC", time.gmtime()),
         "orderId": response.get("orderId"),
         "symbol": response.get("symbol"),
         "side": response.get("side"),
@@ -224,10 +432,10 @@ def api_place_order() -> Tuple[Response, int]:
         "avgPrice": response.get("avgPrice", "N/A"),
         "price": response.get("price", "N/A"),
     }
-    _order_history.insert(0, record)
-    # Cap history to prevent unbounded memory growth
-    if len(_order_history) > _MAX_HISTORY:
-        del _order_history[_MAX_HISTORY:]
+    global _history_json_cache
+    with _history_lock:
+        _order_history.appendleft(record)
+        _history_json_cache = None  # force /api/orders to re-serialize
 
     return _ok(record)
 
@@ -242,16 +450,29 @@ def api_open_orders() -> Tuple[Response, int]:
     except BinanceAPIError as exc:
         return _error(exc, 502)
     except Exception as exc:
-        logger.exception("Open orders error")
+        _log_exc("Open orders error")
         return _error(exc)
 
 
 @app.route("/api/cancel-order", methods=["POST"])
 def api_cancel_order() -> Tuple[Response, int]:
     """Cancel an order.  JSON body: ``{ symbol, orderId }``."""
-    body = request.get_json(silent=True) or {}
-    symbol = body.get("symbol", "")
-    order_id = body.get("orderId")
+    raw = request.get_data(cache=False)
+    if msgspec is not None:
+        try:
+            parsed = _decode_cancel_body(raw) if raw else _CancelBody()
+        except msgspec.DecodeError as exc:
+            return _error(exc, 400)
+        symbol, order_id = parsed.symbol, parsed.orderId
+    else:
+        try:
+            body = orjson.loads(raw) if raw else {}
+        except orjson.JSONDecodeError as exc:
+            return _error(ValueError(f"Invalid JSON body: {exc}"), 400)
+        if not isinstance(body, dict):
+            return _error(ValueError("JSON body must be an object"), 400)
+        symbol = body.get("symbol", "")
+        order_id = body.get("orderId")
 
     if not symbol or order_id is None:
         return _error(ValueError("symbol and orderId are required"), 400)
@@ -268,24 +489,71 @@ def api_cancel_order() -> Tuple[Response, int]:
         logger.error("Cancel error: %s", exc)
         return _error(exc, 502)
     except Exception as exc:
-        logger.exception("Cancel error")
+        _log_exc("Cancel error")
         return _error(exc)
 
 
 @app.route("/api/orders")
 def api_order_history() -> Tuple[Response, int]:
-    """Return the in-memory order history (wrapped in the standard envelope)."""
-    return _ok(_order_history)
+    """Return the in-memory order history (wrapped in the standard envelope).
+
+    Serves a memoized JSON blob; re-serialization only happens after an
+    order placement invalidated it.
+    """
+    global _history_json_cache
+    with _history_lock:
+        if _history_json_cache is None:
+            _history_json_cache = orjson.dumps(
+                {"success": True, "data": list(_order_history)}
+            )
+        payload = _history_json_cache
+    return app.response_class(payload, mimetype="application/json"), 200
+
+
+# Connectivity state maintained by a background probe thread.  The
+# Docker HEALTHCHECK and the dashboard both poll /api/status; answering
+# from this cached tuple keeps the route off the Binance round-trip.
+# Tuple assignment/read is atomic under the GIL, so no lock is needed.
+_STATUS_PROBE_INTERVAL = 5.0
+_status: Tuple[str, Optional[str]] = ("unknown", None)
+_status_probe_started = False
+_status_probe_lock = threading.Lock()
+
+
+def _status_probe() -> None:
+    """Ping Binance every few seconds and record the result."""
+    global _status
+    while True:
+        try:
+            _get_client().ping()
+            _status = ("connected", None)
+        except Exception as exc:
+            _status = ("disconnected", str(exc))
+        time.sleep(_STATUS_PROBE_INTERVAL)
+
+
+def _ensure_status_probe() -> None:
+    """Start the probe thread once per process (lazy — gunicorn workers
+    never execute the ``__main__`` block)."""
+    global _status_probe_started
+    if _status_probe_started:
+        return
+    with _status_probe_lock:
+        if not _status_probe_started:
+            threading.Thread(
+                target=_status_probe, name="status-probe", daemon=True
+            ).start()
+            _status_probe_started = True
 
 
 @app.route("/api/status")
 def api_status() -> Tuple[Response, int]:
-    """Health check — pings Binance and returns connectivity status."""
-    try:
-        _get_client().ping()
-        return jsonify({"success": True, "status": "connected"}), 200
-    except Exception as exc:
-        return jsonify({"success": False, "status": "disconnected", "error": str(exc)}), 200
+    """Health check — returns the last probed connectivity status."""
+    _ensure_status_probe()
+    state, error = _status
+    if state == "disconnected":
+        return jsonify({"success": False, "status": state, "error": error}), 200
+    return jsonify({"success": True, "status": state}), 200
 
 
 # ── Entry point ────────────────────────────────────────────────────────────
@@ -295,17 +563,28 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Trading Bot Web UI")
     parser.add_argument("--port", type=int, default=5000, help="Port (default 5000)")
     parser.add_argument("--host", default="127.0.0.1", help="Host (default 127.0.0.1)")
+    parser.add_argument("--dev", action="store_true",
+                        help="Run the single-threaded Werkzeug dev server")
     cli_args = parser.parse_args()
 
-    # Fail fast if credentials are missing
+    # Fail fast if credentials are missing (local check, no network)
     try:
-        _get_client().ping()
-        logger.info("Binance API reachable ✓")
+        client = _get_client()
     except RuntimeError as e:
         logger.error("%s", e)
         sys.exit(1)
-    except Exception as e:
-        logger.warning("Binance connectivity check failed: %s (starting anyway)", e)
+
+    # Diagnostic-only connectivity check runs in the background so
+    # startup doesn't serialize behind a Binance round-trip; /api/status
+    # serves the cached result of the periodic probe thread.  Started
+    # only on the branches that keep this process alive — the gunicorn
+    # handoff execs over the process before the thread could run.
+    def _startup_ping() -> None:
+        try:
+            client.ping()
+            logger.info("Binance API reachable ✓")
+        except Exception as e:
+            logger.warning("Binance connectivity check failed: %s", e)
 
     debug_mode = os.getenv("FLASK_DEBUG", "0") == "1"
     print(f"\n  🚀 Trading Bot UI → http://{cli_args.host}:{cli_args.port}")
@@ -314,4 +593,31 @@ if __name__ == "__main__":
     else:
         print()
 
-    app.run(host=cli_args.host, port=cli_args.port, debug=debug_mode)
+    if cli_args.dev or debug_mode:
+        threading.Thread(target=_startup_ping, daemon=True).start()
+        app.run(host=cli_args.host, port=cli_args.port, debug=debug_mode)
+    else:
+        # Production path: hand off to gunicorn.  A single worker with a
+        # thread pool gives the IO-bound Binance calls their concurrency
+        # while keeping the per-process state (order history + its JSON
+        # cache, market cache, status probe) coherent and the rotating
+        # log file single-writer — multiple workers would each hold their
+        # own history and race on rotation renames.
+        try:
+            import gunicorn  # noqa: F401
+        except ImportError:
+            logger.warning(
+                "gunicorn not installed — falling back to the dev server "
+                "(pip install gunicorn, or run with --dev to silence this)"
+            )
+            threading.Thread(target=_startup_ping, daemon=True).start()
+            app.run(host=cli_args.host, port=cli_args.port)
+        else:
+            os.execvp("gunicorn", [
+                "gunicorn",
+                "-w", "1",
+                "--threads", "16",
+                "--keep-alive", "15",
+                "-b", f"{cli_args.host}:{cli_args.port}",
+                "web_app:app",
+            ])